@@ -16,7 +16,13 @@ Features:
     - Context highlighting.
 
 Usage (inside active venv):
-python germanSrtAnalysis.py input_file.srt
+python germanSrtAnalysis.py input_file.srt [more_files.srt ...]
+
+Library usage (the model is loaded once and reused):
+    import germanSrtAnalysis
+    nlp = germanSrtAnalysis.load_model()
+    for path in srt_files:
+        germanSrtAnalysis.analyze_srt(path, nlp=nlp)
 """
 
 import spacy
@@ -26,6 +32,9 @@ import argparse
 import re
 import html
 import urllib.parse
+import functools
+import gzip
+import itertools
 
 # --- Configuration ---
 # Mapping internal keys to spaCy POS tags and display titles
@@ -36,51 +45,93 @@ POS_MAP = {
     'adv':  ('ADV',  'Adverbs')
 }
 
-# German definite articles mapping for nouns
+# Reverse mapping from spaCy POS tag to internal key (e.g., 'NOUN' -> 'nom')
+_POS_TO_KEY = {pos_val: key for key, (pos_val, _) in POS_MAP.items()}
+
+# German definite articles mapping for nouns (plural always takes 'die')
 ARTICLE_MAP = {
     'Masc': 'der',
     'Fem':  'die',
-    'Neut': 'das'
+    'Neut': 'das',
+    'Plur': 'die'
 }
 
 LOCALHOST_PORT = 8080 
 
+# Number of SRT blocks spaCy processes per batch (overridable with SRT_BATCH)
+DEFAULT_BATCH_SIZE = 256
+
+# Precompiled regular expressions for SRT parsing
+# SRT timestamp line (Start time --> End time), group 1 captures the start time
+_TS_RE = re.compile(r'(\d{1,2}:\d{2}:\d{2},\d{3}) --> \d{1,2}:\d{2}:\d{2},\d{3}')
+
 # --- Helper Functions ---
 
 def load_model():
-    """Attempts to load the large German spaCy model."""
-    try:
-        return spacy.load("de_core_news_lg")
-    except IOError:
-        sys.stderr.write("\nERROR: spaCy model 'de_core_news_lg' not found.\n")
-        sys.stderr.write("Please install it using: python -m spacy download de_core_news_lg\n")
-        sys.exit(1)
-
-def read_file(filename):
-    """Reads the content of the specified file."""
+    """
+    Loads the large German spaCy model and reports its active components.
+    Raises OSError (with the install command) if the model is not installed.
+    The parser and NER are disabled since only POS, lemma and morphology are used.
+    The attribute_ruler stays enabled because it adjusts POS tags for the lemmatizer.
+    """
+    sys.stderr.write("Loading spaCy model 'de_core_news_lg'...\n")
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        sys.stderr.write(f"\nERROR: File '{filename}' not found.\n")
-        sys.exit(1)
-    except Exception as e:
-        sys.stderr.write(f"\nAn error occurred while reading the file: {e}\n")
-        sys.exit(1)
+        nlp = spacy.load("de_core_news_lg", disable=["parser", "ner"])
+    except IOError as e:
+        raise OSError("spaCy model 'de_core_news_lg' not found.\n"
+                      "Please install it using: python -m spacy download de_core_news_lg") from e
+    sys.stderr.write(f"Model loaded. Active pipeline components: {', '.join(nlp.pipe_names)}\n")
+    return nlp
+
+def iter_srt_blocks(srt_file):
+    """
+    Reads an open SRT file line by line and yields one block at a time.
+    Blocks are separated by blank lines (standard SRT format).
+    """
+    block_lines = []
+    for line in srt_file:
+        if line != "\n":
+            block_lines.append(line)
+        elif block_lines:
+            yield "".join(block_lines)
+            block_lines = []
+    if block_lines:
+        yield "".join(block_lines)
+
+def strip_html_tags(text):
+    """
+    Replaces HTML tags often found in subtitles (e.g., <i>, <font ...>) with a space.
+    Single-pass scan equivalent to re.sub(r'<[^>]+>', ' ', text).
+    """
+    if '<' not in text:
+        return text
+
+    parts = []
+    start = 0
+    tag_start = text.find('<')
+    while tag_start != -1:
+        tag_end = text.find('>', tag_start + 1)
+        if tag_end == -1:
+            break
+        if tag_end == tag_start + 1:
+            # "<>" is not a tag, keep the '<' as text
+            tag_start = text.find('<', tag_start + 1)
+            continue
+        parts.append(text[start:tag_start])
+        start = tag_end + 1
+        tag_start = text.find('<', start)
+    parts.append(text[start:])
+    return ' '.join(parts)
 
 def get_article_from_token(token):
     """Determines the nominative article (der, die, das) for a Noun token."""
-    morph = token.morph
-    number_list = morph.get('Number')
-    # Plural takes precedence
-    if number_list and number_list[0] == 'Plur':
-        return 'die'
-    
-    gender_list = morph.get('Gender')
-    if gender_list:
-        gender = gender_list[0]
-        return ARTICLE_MAP.get(gender, '')
-    return ''
+    # Single parse of the morphology, e.g. {'Gender': 'Masc', 'Number': 'Sing'}
+    features = token.morph.to_dict()
+    # Plural takes precedence over gender (only the first value of each feature is used)
+    feature_value = features.get('Number', '').split(',')[0]
+    if feature_value != 'Plur':
+        feature_value = features.get('Gender', '').split(',')[0]
+    return ARTICLE_MAP.get(feature_value, '')
 
 def get_final_lemma(token):
     """Returns the lemma, automatically adding the article for nouns."""
@@ -93,6 +144,19 @@ def get_final_lemma(token):
 
 # --- Formatting Helper Functions ---
 
+# Bound for the caches below, so they do not grow across files in multi-file/library use
+_FORMAT_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _quote_plus(word):
+    """URL encodes a word (cached, the same words recur across reports)."""
+    return urllib.parse.quote_plus(word)
+
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _escape(text):
+    """HTML escapes a lemma (cached, the same lemmas recur across reports)."""
+    return html.escape(text)
+
 def get_html_cell_content(matches_dict):
     """
     Formats matches for an HTML cell (<strong>, <br>, and <a> hyperlink).
@@ -102,15 +166,13 @@ def get_html_cell_content(matches_dict):
         return ""
     
     links = []
-    # matches_dict structure: {'der Mann': {'Mann', 'Mannes'}, 'die Frau': {'Frau'}}
-    for lemma, original_texts in sorted(matches_dict.items()):
-        display_lemma = html.escape(lemma)
-        
-        # Pick ONE of the original words for the URL generation
-        original_word_for_url = list(original_texts)[0] 
+    # matches_dict structure: {'der Mann': 'Mannes', 'die Frau': 'Frau'} (first-seen original word)
+    # The first-seen original word is used for the URL generation (stable across runs)
+    for lemma, original_word_for_url in sorted(matches_dict.items()):
+        display_lemma = _escape(lemma)
             
         # URL encode the original word (handles umlauts safely)
-        url_encoded_word = urllib.parse.quote_plus(original_word_for_url)
+        url_encoded_word = _quote_plus(original_word_for_url)
         url = f"https://www.verbformen.es/?w={url_encoded_word}"
         
         # Display the Lemma, but link using the original word
@@ -119,6 +181,25 @@ def get_html_cell_content(matches_dict):
     return "<br>".join(links)
 
 
+def get_highlighted_context(report, selection_key):
+    """
+    Builds the HTML context of a sentence report with the matches of one category highlighted.
+    Only called for categories that have matches in the sentence.
+    """
+    tokens_to_highlight = report['tokens_by_key'][selection_key]
+    esc_text = report['esc_text']
+    esc_ws = report['esc_ws']
+    # Append the pieces as they are and join once (no intermediate per-token strings)
+    parts = []
+    for i, text_escaped in enumerate(esc_text):
+        if i in tokens_to_highlight:
+            parts.extend(('<strong class="highlight">', text_escaped, '</strong>'))
+        else:
+            parts.append(text_escaped)
+        parts.append(esc_ws[i])
+    return "".join(parts).replace("\n", "<br>")
+
+
 def get_md_cell_content(matches_dict):
     """
     Formats matches for a Markdown cell (backticks and spaces).
@@ -130,91 +211,78 @@ def get_md_cell_content(matches_dict):
     sanitized_lemmas = [g.replace('`', r'\`') for g in lemmas]
     return " ".join([f"`{g}`" for g in sanitized_lemmas])
 
-def get_html_header(title):
-    """Returns the HTML header including CSS styles."""
-    return f"""<!DOCTYPE html>
+# The HTML header is split around the title so it can be built by plain concatenation
+_HTML_HEADER_PREFIX = """<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>"""
+
+_HTML_HEADER_SUFFIX = """</title>
     <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; line-height: 1.6; margin: 2em; }}
-        table {{ 
+        body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; line-height: 1.6; margin: 2em; }
+        table { 
             width: 100%; 
             border-collapse: collapse;
             margin-bottom: 2em;
             table-layout: fixed;
-        }}
-        th, td {{ 
+        }
+        th, td { 
             border: 1px solid #ddd;
             padding: 8px 12px;
             text-align: left;
             vertical-align: top;
             word-wrap: break-word;
-        }}
-        th {{ background-color: #f4f4f4; }}
+        }
+        th { background-color: #f4f4f4; }
         
         /* Individual Reports: Context (60%), Matches (30%), Time (10%) */
-        .single-report th:nth-child(1), .single-report td:nth-child(1) {{ width: 60%; }}
-        .single-report th:nth-child(2), .single-report td:nth-child(2) {{ width: 30%; }}
-        .single-report th:nth-child(3), .single-report td:nth-child(3) {{ width: 10%; font-size: 0.9em; color: #555; }}
+        .single-report th:nth-child(1), .single-report td:nth-child(1) { width: 60%; }
+        .single-report th:nth-child(2), .single-report td:nth-child(2) { width: 30%; }
+        .single-report th:nth-child(3), .single-report td:nth-child(3) { width: 10%; font-size: 0.9em; color: #555; }
         
         /* Combined Report: Context (30%), 4x Matches (15% each), Time (10%) */
-        .combined th:nth-child(1), .combined td:nth-child(1) {{ width: 30%; }}
-        .combined th:nth-child(2), .combined td:nth-child(2) {{ width: 15%; }}
-        .combined th:nth-child(3), .combined td:nth-child(3) {{ width: 15%; }}
-        .combined th:nth-child(4), .combined td:nth-child(4) {{ width: 15%; }}
-        .combined th:nth-child(5), .combined td:nth-child(5) {{ width: 15%; }}
-        .combined th:nth-child(6), .combined td:nth-child(6) {{ width: 10%; font-size: 0.9em; color: #555; }}
-
-        h1, h2, h3, h4 {{ border-bottom: 2px solid #f4f4f4; padding-bottom: 5px; }}
-        ul {{ padding-left: 20px; }}
-        li {{ margin-bottom: 5px; }}
-        strong {{ color: #333; }}
-        td strong.highlight {{ background-color: #fff8c5; padding: 0 2px; }}
+        .combined th:nth-child(1), .combined td:nth-child(1) { width: 30%; }
+        .combined th:nth-child(2), .combined td:nth-child(2) { width: 15%; }
+        .combined th:nth-child(3), .combined td:nth-child(3) { width: 15%; }
+        .combined th:nth-child(4), .combined td:nth-child(4) { width: 15%; }
+        .combined th:nth-child(5), .combined td:nth-child(5) { width: 15%; }
+        .combined th:nth-child(6), .combined td:nth-child(6) { width: 10%; font-size: 0.9em; color: #555; }
+
+        h1, h2, h3, h4 { border-bottom: 2px solid #f4f4f4; padding-bottom: 5px; }
+        ul { padding-left: 20px; }
+        li { margin-bottom: 5px; }
+        strong { color: #333; }
+        td strong.highlight { background-color: #fff8c5; padding: 0 2px; }
         
         /* Link Styles */
-        a {{ text-decoration: none; color: #005fcc; }}
-        a:hover {{ text-decoration: underline; }}
+        a { text-decoration: none; color: #005fcc; }
+        a:hover { text-decoration: underline; }
         /* Make timestamp links less obtrusive */
-        td:nth-child(3) a, .combined td:nth-child(6) a {{ color: #444; }} 
+        td:nth-child(3) a, .combined td:nth-child(6) a { color: #444; } 
     </style>
 </head>
 <body>
 """
 
+def get_html_header(title):
+    """Returns the HTML header including CSS styles."""
+    return _HTML_HEADER_PREFIX + title + _HTML_HEADER_SUFFIX
+
 # --- Main Logic (Analysis) ---
 
-def analyze_text_and_create_data(nlp, raw_text):
+def parse_srt_blocks(srt_blocks):
     """
-    Analyzes the raw text by parsing SRT blocks to extract timestamps
-    and linguistic data.
-    
-    Returns:
-        - List of sentence dictionaries (for tables)
-        - Dictionary of global unique lemmas mapping to original texts
-        - Dictionary of total counts
+    Extracts the start timestamp and the cleaned text of each SRT block.
+    Yields (text, timestamp) pairs, skipping blocks without timestamp or text.
     """
-    
-    sentence_reports = [] 
-    # global_lemmas_map stores { 'verb': {'lassen': {'Lass'}, ...}, ...}
-    global_lemmas_map = {key: {} for key in POS_MAP.keys()}
-    global_totals = {key: 0 for key in POS_MAP.keys()}
-
-    # Regex to find SRT timestamps (Start time --> End time)
-    # We capture group 1 (Start time)
-    timestamp_regex = re.compile(r'(\d{1,2}:\d{2}:\d{2},\d{3}) --> \d{1,2}:\d{2}:\d{2},\d{3}')
-    
-    # Split text into blocks based on double newlines (standard SRT format)
-    srt_blocks = re.split(r'\n{2,}', raw_text)
-
     for block in srt_blocks:
         block = block.strip()
         if not block:
             continue
 
-        timestamp_match = timestamp_regex.search(block)
+        timestamp_match = _TS_RE.search(block)
         
         if not timestamp_match:
             continue
@@ -224,74 +292,90 @@ def analyze_text_and_create_data(nlp, raw_text):
         # Extract text after the timestamp
         text_content_raw = block[timestamp_match.end():].strip()
         # Clean HTML tags often found in subtitles (e.g., <i>)
-        text_content_clean = re.sub(r'<[^>]+>', ' ', text_content_raw).strip()
+        text_content_clean = strip_html_tags(text_content_raw).strip()
         
         if not text_content_clean:
             continue
 
-        # Process this specific block with spaCy
-        doc_chunk = nlp(text_content_clean)
+        yield text_content_clean, timestamp
+
+
+def analyze_srt_blocks_and_create_data(nlp, srt_blocks, n_process=1, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Analyzes an iterable of SRT blocks (e.g. from iter_srt_blocks) to extract timestamps
+    and linguistic data.
+    With n_process > 1 (or -1 for all CPU cores), spaCy distributes the blocks over several worker processes.
+    batch_size is the number of blocks spaCy processes per batch.
+    
+    Returns:
+        - List of sentence dictionaries (for tables)
+        - Dictionary of global unique lemmas mapping to their first-seen original text
+        - Dictionary of total counts
+    """
+    # A plain string would be iterated character by character and silently yield no results
+    if isinstance(srt_blocks, str):
+        raise TypeError("srt_blocks must be an iterable of SRT blocks (e.g. iter_srt_blocks(f)), not a str")
+    
+    sentence_reports = [] 
+    # global_lemmas_map stores { 'verb': {'lassen': 'Lass', ...}, ...} (first-seen original text)
+    global_lemmas_map = {key: {} for key in POS_MAP.keys()}
+    global_totals = {key: 0 for key in POS_MAP.keys()}
+    # lemma_cache stores { (pos, lemma, morph) hashes: 'der Mann', ...}
+    lemma_cache = {}
+
+    # Process the blocks in batches with spaCy while they are read from the file
+    # (timestamps are passed through as context via as_tuples)
+    texts_with_timestamps = parse_srt_blocks(srt_blocks)
+    for doc_chunk, timestamp in nlp.pipe(texts_with_timestamps, as_tuples=True, batch_size=batch_size, n_process=n_process):
+        text_content_clean = doc_chunk.text
             
-        # matches_in_sentence_map stores { 'nom': {'der Mann': {'Mannes'}}, ...}
+        # matches_in_sentence_map stores { 'nom': {'der Mann': 'Mannes'}, ...}
         matches_in_sentence_map = {key: {} for key in POS_MAP.keys()}
-        matches_in_sentence_tokens = {key: [] for key in POS_MAP.keys()}
+        # Only token indices are kept, so no Token (and Doc) outlives this iteration
+        matches_in_sentence_tokens = {key: set() for key in POS_MAP.keys()}
         
         for token in doc_chunk:
             # Identify if token matches one of our target POS tags
-            selection_key = next((key for key, (pos_val, _) in POS_MAP.items() if pos_val == token.pos_), None)
+            selection_key = _POS_TO_KEY.get(token.pos_)
+            if not selection_key:
+                continue
+
+            # Repeated words share the same POS, lemma and morphology: compute their final lemma once
+            lemma_cache_key = (token.pos, token.lemma, token.morph.key)
+            lemma = lemma_cache.get(lemma_cache_key)
+            if lemma is None:
+                lemma = lemma_cache[lemma_cache_key] = get_final_lemma(token)
+            original_text = token.text
+            
+            # 1. Populate Sentence Data
+            matches_in_sentence_map[selection_key].setdefault(lemma, original_text)
+
+            # 2. Populate Global Data (Summary)
+            global_lemmas_map[selection_key].setdefault(lemma, original_text)
             
-            if selection_key:
-                lemma = get_final_lemma(token)
-                original_text = token.text
-                
-                # 1. Populate Sentence Data
-                if lemma not in matches_in_sentence_map[selection_key]:
-                    matches_in_sentence_map[selection_key][lemma] = set()
-                matches_in_sentence_map[selection_key][lemma].add(original_text)
-
-                # 2. Populate Global Data (Summary)
-                if lemma not in global_lemmas_map[selection_key]:
-                    global_lemmas_map[selection_key][lemma] = set()
-                global_lemmas_map[selection_key][lemma].add(original_text)
-                
-                matches_in_sentence_tokens[selection_key].append(token)
-                global_totals[selection_key] += 1
+            matches_in_sentence_tokens[selection_key].add(token.i)
+            global_totals[selection_key] += 1
 
         # Skip block if no relevant words found
         if not any(matches_in_sentence_map.values()):
             continue
         
         # Prepare Context Strings
+        # Escape token texts once per Doc, reused by the plain and every highlighted context
+        esc_text = [html.escape(t.text) for t in doc_chunk]
+        esc_ws = [html.escape(t.whitespace_) for t in doc_chunk]
         context_md = text_content_clean.replace("|", "\|").replace("\n", " ")
-        context_html_plain = html.escape(text_content_clean).replace("\n", "<br>")
+        # Reuse the escaped tokens: text + whitespace of all tokens is exactly the block text
+        context_html_plain = "".join(itertools.chain.from_iterable(zip(esc_text, esc_ws))).replace("\n", "<br>")
         
-        highlighted_contexts_map = {}
-        
-        # Generate highlighted HTML context for each category
-        for key in POS_MAP.keys():
-            tokens_to_highlight = {t.i for t in matches_in_sentence_tokens[key]}
-            
-            if not tokens_to_highlight:
-                highlighted_contexts_map[key] = context_html_plain
-                continue
-
-            highlighted_str = ""
-            for t in doc_chunk:
-                text_escaped = html.escape(t.text)
-                whitespace_escaped = html.escape(t.whitespace_)
-                
-                if t.i in tokens_to_highlight:
-                    highlighted_str += f'<strong class="highlight">{text_escaped}</strong>{whitespace_escaped}'
-                else:
-                    highlighted_str += f"{text_escaped}{whitespace_escaped}"
-            
-            highlighted_contexts_map[key] = highlighted_str.replace("\n", "<br>")
-
         sentence_reports.append({
             'context_md': context_md,
             'context_html_plain': context_html_plain,
             'matches_map': matches_in_sentence_map, 
-            'highlighted_contexts': highlighted_contexts_map,
+            # Highlighted contexts are built lazily by the HTML writer
+            'tokens_by_key': {key: frozenset(indices) for key, indices in matches_in_sentence_tokens.items()},
+            'esc_text': esc_text,
+            'esc_ws': esc_ws,
             'timestamp': timestamp
         })
         
@@ -300,213 +384,318 @@ def analyze_text_and_create_data(nlp, raw_text):
 
 # --- Output Writers (HTML + Markdown) ---
 
-def write_html_reports(sentence_reports, global_lemmas_map, global_totals, output_folder, input_filename):
+def get_timestamp_cell(timestamp):
+    """Formats the start time as a link to the local video player."""
+    timestamp_url = f"http://localhost:{LOCALHOST_PORT}/?time={timestamp}"
+    return f'<a href="{timestamp_url}" target="_blank" title="Jump to time (localhost)">{timestamp}</a>'
+
+def prepare_report_cells(sentence_reports):
     """
-    Writes all 5 HTML reports.
+    Renders the HTML and Markdown match cells of every sentence report once,
+    so the individual and combined reports can share them.
     """
+    for report in sentence_reports:
+        matches_map = report['matches_map']
+        report['html_cells'] = {key: get_html_cell_content(matches_map[key]) for key in POS_MAP.keys()}
+        report['md_cells'] = {key: get_md_cell_content(matches_map[key]) for key in POS_MAP.keys()}
+
+def render_row_html(report, selection_key):
+    """Renders one table row of an individual HTML report."""
+    matches_cell = report['html_cells'][selection_key]
+    context_cell = get_highlighted_context(report, selection_key)
+    timestamp_cell = get_timestamp_cell(report['timestamp'])
+    return f"    <tr><td>{context_cell}</td><td>{matches_cell}</td><td>{timestamp_cell}</td></tr>\n"
+
+def render_combined_row_html(report):
+    """Renders one table row of the combined HTML report."""
+    html_cells = report['html_cells']
+    return ("    <tr>\n"
+            f"      <td>{report['context_html_plain']}</td>\n"
+            f"      <td>{html_cells['adj']}</td>\n"
+            f"      <td>{html_cells['verb']}</td>\n"
+            f"      <td>{html_cells['nom']}</td>\n"
+            f"      <td>{html_cells['adv']}</td>\n"
+            f"      <td>{get_timestamp_cell(report['timestamp'])}</td>\n"
+            "    </tr>\n")
+
+def render_row_md(report, selection_key):
+    """Renders one table row of an individual Markdown report."""
+    matches_cell = report['md_cells'][selection_key]
+    return f"| {report['context_md']} | {matches_cell} | {report['timestamp']} |\n"
+
+def render_combined_row_md(report):
+    """Renders one table row of the combined Markdown report."""
+    md_cells = report['md_cells']
+    return (f"| {report['context_md']} | "
+            f"{md_cells['adj']} | "
+            f"{md_cells['verb']} | "
+            f"{md_cells['nom']} | "
+            f"{md_cells['adv']} | "
+            f"{report['timestamp']} |\n")
+
+def write_report(output_path, parts, compress=False):
+    """
+    Writes the collected report parts to disk with a single write call.
+    With compress=True the report is saved gzip-compressed as '<output_path>.gz'.
+    """
+    if compress:
+        output_path = f"{output_path}.gz"
+        # Level 1 is nearly as fast as a plain write and the tables compress very well
+        open_report = functools.partial(gzip.open, compresslevel=1)
+    else:
+        open_report = open
+    try:
+        with open_report(output_path, "wt", encoding="utf-8") as f:
+            f.write("".join(parts))
+        sys.stderr.write(f"-> Created '{output_path}'\n")
+    except Exception as e:
+        sys.stderr.write(f"\nERROR writing '{output_path}': {e}\n")
+
+def write_single_html_report(selection_key, sentence_reports, global_lemmas_map, global_totals, output_folder, input_filename, compress=False):
+    """
+    Writes the individual HTML report of one category.
+    """
+    title_plural = POS_MAP[selection_key][1]
+    filename = f"{input_filename}.{title_plural.lower()}.html"
+    output_path = os.path.join(output_folder, filename)
+    total = global_totals[selection_key]
+    lemmas_map = global_lemmas_map[selection_key] 
     
-    # 1. Write the 4 Individual Reports
-    for selection_key, (_, title_plural) in POS_MAP.items():
-        filename = f"{input_filename}.{title_plural.lower()}.html"
-        output_path = os.path.join(output_folder, filename)
-        total = global_totals[selection_key]
-        lemmas_map = global_lemmas_map[selection_key] 
+    parts = [
+        get_html_header(f"{title_plural} Analysis"),
+        f"<h1>{title_plural} Analysis</h1>\n",
+        f"<h2>File: <code>{input_filename}</code></h2>\n",
+    ]
+    
+    if total == 0:
+        parts.append(f"<p>No {title_plural.lower()} found in text.</p>\n")
+    else:
+        parts.append("<table class=\"single-report\">\n")
+        parts.append("  <thead><tr><th>Context (Highlighted)</th><th>Found Lemmas</th><th>Start Time</th></tr></thead>\n")
+        parts.append("  <tbody>\n")
+        for report in sentence_reports:
+            if report['matches_map'][selection_key]:
+                parts.append(render_row_html(report, selection_key))
+        parts.append("  </tbody>\n</table>\n")
+
+    parts.append("<h3>Summary</h3>\n")
+    if total == 0:
+        parts.append("<p>No instances found.</p>\n")
+    else:
+        parts.append(f"<p>Total found: <strong>{total}</strong> instances.</p>\n")
+        parts.append("<h4>Unique Lemmas List:</h4>\n<ul>\n")
         
-        try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(get_html_header(f"{title_plural} Analysis"))
-                f.write(f"<h1>{title_plural} Analysis</h1>\n")
-                f.write(f"<h2>File: <code>{input_filename}</code></h2>\n")
-                
-                if total == 0:
-                    f.write(f"<p>No {title_plural.lower()} found in text.</p>\n")
-                else:
-                    f.write("<table class=\"single-report\">\n")
-                    f.write("  <thead><tr><th>Context (Highlighted)</th><th>Found Lemmas</th><th>Start Time</th></tr></thead>\n")
-                    f.write("  <tbody>\n")
-                    for report in sentence_reports:
-                        matches_for_cat = report['matches_map'][selection_key]
-                        if matches_for_cat:
-                            matches_cell = get_html_cell_content(matches_for_cat)
-                            context_cell = report['highlighted_contexts'][selection_key]
-                            
-                            timestamp = report['timestamp']
-                            timestamp_url = f"http://localhost:{LOCALHOST_PORT}/?time={timestamp}"
-                            timestamp_cell = f'<a href="{timestamp_url}" target="_blank" title="Jump to time (localhost)">{timestamp}</a>'
-                            
-                            f.write(f"    <tr><td>{context_cell}</td><td>{matches_cell}</td><td>{timestamp_cell}</td></tr>\n")
-                    f.write("  </tbody>\n</table>\n")
-
-                f.write("<h3>Summary</h3>\n")
-                if total == 0:
-                    f.write("<p>No instances found.</p>\n")
-                else:
-                    f.write(f"<p>Total found: <strong>{total}</strong> instances.</p>\n")
-                    f.write("<h4>Unique Lemmas List:</h4>\n<ul>\n")
-                    
-                    for lemma, original_texts in sorted(lemmas_map.items()):
-                        display_lemma = html.escape(lemma)
-                        original_word_for_url = list(original_texts)[0]
-                        url_encoded_word = urllib.parse.quote_plus(original_word_for_url)
-                        url = f"https://www.verbformen.es/?w={url_encoded_word}"
-                        f.write(f'  <li><a href="{url}" target="_blank" title="Lookup: {original_word_for_url}"><strong>{display_lemma}</strong></a></li>\n')
-                    
-                    f.write("</ul>\n")
-                f.write("</body>\n</html>\n")
-            
-            sys.stderr.write(f"-> Created '{output_path}'\n")
-        except Exception as e:
-            sys.stderr.write(f"\nERROR writing '{output_path}': {e}\n")
+        for lemma, original_word_for_url in sorted(lemmas_map.items()):
+            display_lemma = _escape(lemma)
+            url_encoded_word = _quote_plus(original_word_for_url)
+            url = f"https://www.verbformen.es/?w={url_encoded_word}"
+            parts.append(f'  <li><a href="{url}" target="_blank" title="Lookup: {original_word_for_url}"><strong>{display_lemma}</strong></a></li>\n')
+        
+        parts.append("</ul>\n")
+    parts.append("</body>\n</html>\n")
+    
+    write_report(output_path, parts, compress)
 
-    # 2. Write the Combined Report
+
+def write_combined_html_report(sentence_reports, output_folder, input_filename, compress=False):
+    """
+    Writes the combined HTML report (all categories in one table).
+    """
     filename_combined = f"{input_filename}.combined.html"
     output_path_combined = os.path.join(output_folder, filename_combined)
-    try:
-        with open(output_path_combined, "w", encoding="utf-8") as f:
-            f.write(get_html_header("Combined Analysis"))
-            f.write(f"<h1>Combined Analysis</h1>\n")
-            f.write(f"<h2>File: <code>{input_filename}</code></h2>\n")
-            
-            if not sentence_reports:
-                f.write("<p>No words found in text.</p>\n")
-            else:
-                f.write("<table class=\"combined\">\n")
-                f.write("  <thead><tr><th>Context</th><th>Adjectives</th><th>Verbs</th><th>Nouns</th><th>Adverbs</th><th>Start Time</th></tr></thead>\n")
-                f.write("  <tbody>\n")
-                for report in sentence_reports:
-                    timestamp = report['timestamp']
-                    timestamp_url = f"http://localhost:{LOCALHOST_PORT}/?time={timestamp}"
-                    timestamp_cell = f'<a href="{timestamp_url}" target="_blank" title="Jump to time (localhost)">{timestamp}</a>'
-                    
-                    f.write("    <tr>\n")
-                    f.write(f"      <td>{report['context_html_plain']}</td>\n")
-                    f.write(f"      <td>{get_html_cell_content(report['matches_map']['adj'])}</td>\n")
-                    f.write(f"      <td>{get_html_cell_content(report['matches_map']['verb'])}</td>\n")
-                    f.write(f"      <td>{get_html_cell_content(report['matches_map']['nom'])}</td>\n")
-                    f.write(f"      <td>{get_html_cell_content(report['matches_map']['adv'])}</td>\n")
-                    f.write(f"      <td>{timestamp_cell}</td>\n")
-                    f.write("    </tr>\n")
-                f.write("  </tbody>\n</table>\n")
-            f.write("</body>\n</html>\n")
-        sys.stderr.write(f"-> Created '{output_path_combined}'\n")
-    except Exception as e:
-        sys.stderr.write(f"\nERROR writing '{output_path_combined}': {e}\n")
+    parts = [
+        get_html_header("Combined Analysis"),
+        "<h1>Combined Analysis</h1>\n",
+        f"<h2>File: <code>{input_filename}</code></h2>\n",
+    ]
+    
+    if not sentence_reports:
+        parts.append("<p>No words found in text.</p>\n")
+    else:
+        parts.append("<table class=\"combined\">\n")
+        parts.append("  <thead><tr><th>Context</th><th>Adjectives</th><th>Verbs</th><th>Nouns</th><th>Adverbs</th><th>Start Time</th></tr></thead>\n")
+        parts.append("  <tbody>\n")
+        parts.extend(render_combined_row_html(report) for report in sentence_reports)
+        parts.append("  </tbody>\n</table>\n")
+    parts.append("</body>\n</html>\n")
+    
+    write_report(output_path_combined, parts, compress)
 
 
-def write_markdown_reports(sentence_reports, global_lemmas_map, global_totals, output_folder, input_filename):
+def write_single_markdown_report(selection_key, sentence_reports, global_lemmas_map, global_totals, output_folder, input_filename, compress=False):
     """
-    Writes all 5 Markdown reports.
+    Writes the individual Markdown report of one category.
     """
+    title_plural = POS_MAP[selection_key][1]
+    filename = f"{input_filename}.{title_plural.lower()}.md"
+    output_path = os.path.join(output_folder, filename)
+    total = global_totals[selection_key]
+    lemmas_map = global_lemmas_map[selection_key]
     
-    # 1. The 4 Individual Reports
-    for selection_key, (_, title_plural) in POS_MAP.items():
-        filename = f"{input_filename}.{title_plural.lower()}.md"
-        output_path = os.path.join(output_folder, filename)
-        total = global_totals[selection_key]
-        lemmas_map = global_lemmas_map[selection_key]
-        
-        try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(f"# {title_plural} Analysis\n")
-                f.write(f"## File: `{input_filename}`\n\n---\n\n")
-                
-                if total == 0:
-                    f.write(f"No {title_plural.lower()} found in text.\n")
-                else:
-                    f.write("| Context | Found Lemmas | Start Time |\n")
-                    f.write("| :--- | :--- | :--- |\n")
-                    for report in sentence_reports:
-                        matches_for_cat = report['matches_map'][selection_key]
-                        if matches_for_cat:
-                            matches_cell = get_md_cell_content(matches_for_cat)
-                            f.write(f"| {report['context_md']} | {matches_cell} | {report['timestamp']} |\n")
-                
-                f.write("\n\n## Summary\n")
-                if total == 0:
-                    f.write("No instances found.\n")
-                else:
-                    f.write(f"Total instances found: **{total}**\n")
-                    f.write("\n**Unique Lemmas List:**\n\n")
-                    for lemma in sorted(lemmas_map.keys()):
-                        f.write(f"* `{lemma}`\n")
-            
-            sys.stderr.write(f"-> Created '{output_path}'\n")
-        except Exception as e:
-            sys.stderr.write(f"\nERROR writing '{output_path}': {e}\n")
+    parts = [
+        f"# {title_plural} Analysis\n",
+        f"## File: `{input_filename}`\n\n---\n\n",
+    ]
+    
+    if total == 0:
+        parts.append(f"No {title_plural.lower()} found in text.\n")
+    else:
+        parts.append("| Context | Found Lemmas | Start Time |\n")
+        parts.append("| :--- | :--- | :--- |\n")
+        for report in sentence_reports:
+            if report['matches_map'][selection_key]:
+                parts.append(render_row_md(report, selection_key))
+    
+    parts.append("\n\n## Summary\n")
+    if total == 0:
+        parts.append("No instances found.\n")
+    else:
+        parts.append(f"Total instances found: **{total}**\n")
+        parts.append("\n**Unique Lemmas List:**\n\n")
+        for lemma in sorted(lemmas_map.keys()):
+            parts.append(f"* `{lemma}`\n")
+    
+    write_report(output_path, parts, compress)
+
 
-    # 2. The Combined Report
+def write_combined_markdown_report(sentence_reports, output_folder, input_filename, compress=False):
+    """
+    Writes the combined Markdown report (all categories in one table).
+    """
     filename_combined = f"{input_filename}.combined.md"
     output_path_combined = os.path.join(output_folder, filename_combined)
-    try:
-        with open(output_path_combined, "w", encoding="utf-8") as f:
-            f.write(f"# Combined Analysis\n")
-            f.write(f"## File: `{input_filename}`\n\n---\n\n")
-            
-            if not sentence_reports:
-                f.write("No words found in text.\n")
-            else:
-                f.write("| Context | Adjectives | Verbs | Nouns | Adverbs | Start Time |\n")
-                f.write("| :--- | :--- | :--- | :--- | :--- | :--- |\n")
-                for report in sentence_reports:
-                    f.write(f"| {report['context_md']} | "
-                            f"{get_md_cell_content(report['matches_map']['adj'])} | "
-                            f"{get_md_cell_content(report['matches_map']['verb'])} | "
-                            f"{get_md_cell_content(report['matches_map']['nom'])} | "
-                            f"{get_md_cell_content(report['matches_map']['adv'])} | "
-                            f"{report['timestamp']} |\n")
-        
-        sys.stderr.write(f"-> Created '{output_path_combined}'\n")
-    except Exception as e:
-        sys.stderr.write(f"\nERROR writing '{output_path_combined}': {e}\n")
+    parts = [
+        "# Combined Analysis\n",
+        f"## File: `{input_filename}`\n\n---\n\n",
+    ]
+    
+    if not sentence_reports:
+        parts.append("No words found in text.\n")
+    else:
+        parts.append("| Context | Adjectives | Verbs | Nouns | Adverbs | Start Time |\n")
+        parts.append("| :--- | :--- | :--- | :--- | :--- | :--- |\n")
+        parts.extend(render_combined_row_md(report) for report in sentence_reports)
+    
+    write_report(output_path_combined, parts, compress)
 
-# --- Entry Point ---
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Analyzes a German SRT file and generates 10 reports (5x HTML, 5x MD).",
-        epilog="Example: python germanSrtAnalysis.py my_movie.srt"
-    )
-    parser.add_argument(
-        'filename',
-        help="The input SRT file to analyze."
-    )
-    
-    args = parser.parse_args()
+def write_all_reports(sentence_reports, global_lemmas_map, global_totals, output_folder, input_filename, compress=False):
+    """
+    Writes all 10 reports (5 HTML + 5 Markdown).
+    """
+    prepare_report_cells(sentence_reports)
+
+    for selection_key in POS_MAP.keys():
+        write_single_html_report(selection_key, sentence_reports, global_lemmas_map, global_totals,
+                                 output_folder, input_filename, compress)
+    write_combined_html_report(sentence_reports, output_folder, input_filename, compress)
+
+    for selection_key in POS_MAP.keys():
+        write_single_markdown_report(selection_key, sentence_reports, global_lemmas_map, global_totals,
+                                     output_folder, input_filename, compress)
+    write_combined_markdown_report(sentence_reports, output_folder, input_filename, compress)
+
+# --- Library API ---
+
+def analyze_srt(filename, nlp=None, n_process=1, compress=False, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Analyzes one SRT file and writes its 10 reports into an "Analyse" folder next to it.
+    Pass an already loaded nlp to reuse the model across several files
+    (loading de_core_news_lg takes several seconds).
     
+    Returns the path of the output folder.
+    Raises OSError (e.g. FileNotFoundError) if the file cannot be read, the
+    output folder cannot be created or (with nlp=None) the model is not installed,
+    and UnicodeDecodeError if the file is not UTF-8.
+    """
+    if nlp is None:
+        nlp = load_model()
+
     # --- Path Setup ---
-    input_file_path = os.path.abspath(args.filename)
+    input_file_path = os.path.abspath(filename)
     base_folder = os.path.dirname(input_file_path)
     input_filename_ext = os.path.basename(input_file_path)
     filename_no_ext = os.path.splitext(input_filename_ext)[0]
     
     output_folder = os.path.join(base_folder, "Analyse")
-    
-    try:
-        os.makedirs(output_folder, exist_ok=True)
-    except Exception as e:
-        sys.stderr.write(f"ERROR: Could not create output folder '{output_folder}': {e}\n")
-        sys.exit(1)
 
-    # --- Execution ---
-    sys.stderr.write("Loading spaCy model 'de_core_news_lg'...\n")
-    nlp = load_model()
-    
+    # Open the file before anything else, so I/O errors surface before the analysis starts
     sys.stderr.write(f"Reading file: {input_filename_ext}...\n")
-    raw_text = read_file(input_file_path)
-    
-    sys.stderr.write("Model loaded. Starting Analysis (SRT Mode)...\n")
+    with open(input_file_path, "r", encoding="utf-8") as srt_file:
+        os.makedirs(output_folder, exist_ok=True)
+
+        # --- Execution ---
+        sys.stderr.write("Starting Analysis (SRT Mode)...\n")
 
-    # Analyze
-    sentence_reports, global_lemmas_map, global_totals = analyze_text_and_create_data(nlp, raw_text)
+        # Analyze (the blocks are streamed from the open file)
+        sentence_reports, global_lemmas_map, global_totals = analyze_srt_blocks_and_create_data(nlp, iter_srt_blocks(srt_file), n_process=n_process, batch_size=batch_size)
 
     # Write Reports
-    sys.stderr.write("\nWriting HTML Reports...\n")
-    write_html_reports(sentence_reports, global_lemmas_map, global_totals, output_folder, filename_no_ext)
-    
-    sys.stderr.write("\nWriting Markdown Reports...\n")
-    write_markdown_reports(sentence_reports, global_lemmas_map, global_totals, output_folder, filename_no_ext)
+    sys.stderr.write("\nWriting HTML and Markdown Reports...\n")
+    write_all_reports(sentence_reports, global_lemmas_map, global_totals, output_folder, filename_no_ext, compress=compress)
     
     sys.stderr.write(f"\nSuccess! All 10 reports saved in '{output_folder}'.\n")
+    return output_folder
+
+# --- Entry Point ---
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Analyzes German SRT files and generates 10 reports (5x HTML, 5x MD) per file.",
+        epilog="Example: python germanSrtAnalysis.py my_movie.srt"
+    )
+    parser.add_argument(
+        'filenames',
+        nargs='+',
+        metavar='filename',
+        help="The input SRT file(s) to analyze. The model is loaded only once for all files."
+    )
+    parser.add_argument(
+        '--n-process',
+        type=int,
+        default=1,
+        help="Number of worker processes for spaCy (default: 1, -1 uses all CPU cores). Do not combine with GPU usage."
+    )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help="Save the reports gzip-compressed (.html.gz / .md.gz)."
+    )
+    
+    args = parser.parse_args()
+    if args.n_process < 1 and args.n_process != -1:
+        parser.error("--n-process must be a positive integer or -1 (all CPU cores)")
+
+    # The spaCy batch size can be tuned with the SRT_BATCH environment variable
+    batch_size_env = os.environ.get('SRT_BATCH', str(DEFAULT_BATCH_SIZE))
+    try:
+        batch_size = int(batch_size_env)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        parser.error(f"SRT_BATCH must be a positive integer (got '{batch_size_env}')")
+
+    try:
+        nlp = load_model()
+    except OSError as e:
+        sys.stderr.write(f"\nERROR: {e}\n")
+        sys.exit(1)
+
+    # A bad file is reported and skipped, the remaining files are still analyzed
+    failed_files = []
+    for filename in args.filenames:
+        try:
+            analyze_srt(filename, nlp=nlp, n_process=args.n_process, compress=args.gzip, batch_size=batch_size)
+        except FileNotFoundError:
+            sys.stderr.write(f"\nERROR: File '{filename}' not found.\n")
+            failed_files.append(filename)
+        except (OSError, UnicodeDecodeError) as e:
+            sys.stderr.write(f"\nERROR: Could not analyze '{filename}': {e}\n")
+            failed_files.append(filename)
+
+    if failed_files:
+        sys.stderr.write(f"\n{len(failed_files)} of {len(args.filenames)} file(s) could not be analyzed.\n")
+        sys.exit(1)
 
 
 if __name__ == "__main__":